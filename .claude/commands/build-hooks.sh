@@ -0,0 +1,51 @@
+#!/bin/bash
+# /build-hooks - Compila a estrutura comum dos hooks (_framework.py) com mypyc
+# O módulo compilado (.so) é importado automaticamente no lugar do .py;
+# sem ele (ou sem mypyc) os hooks seguem funcionando em Python puro.
+# Se o .py for editado depois do build, o .so percebe e usa o código-fonte.
+# Uso: build-hooks.sh [--clean]
+
+HOOKS_DIR="$(cd "$(dirname "$0")/../hooks" && pwd)"
+
+# Remover módulo compilado anterior (evita usar uma versão desatualizada)
+rm -f "$HOOKS_DIR"/_framework.*.so
+
+if [ "$1" = "--clean" ]; then
+    echo "🧹 Módulo compilado removido - hooks em Python puro"
+    exit 0
+fi
+
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo "⚙️ BUILD DOS HOOKS DE VALIDAÇÃO"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo ""
+
+if ! python3 -c "import mypyc" 2>/dev/null; then
+    echo "⚠️ mypyc não instalado (pip install mypy) - hooks seguem em Python puro"
+    exit 0
+fi
+
+# Compilar fora do repositório para não deixar build/ e arquivos C para trás
+BUILD_DIR=$(mktemp -d)
+trap 'rm -rf "$BUILD_DIR"' EXIT
+# Gravar o mtime do código-fonte na cópia compilada (lido antes de copiar: uma edição
+# durante o build também conta como .so desatualizado)
+SOURCE_MTIME_NS=$(python3 -c 'import os, sys; print(os.stat(sys.argv[1]).st_mtime_ns)' "$HOOKS_DIR/_framework.py")
+sed "s/^BUILD_SOURCE_MTIME_NS = 0$/BUILD_SOURCE_MTIME_NS = $SOURCE_MTIME_NS/" \
+    "$HOOKS_DIR/_framework.py" > "$BUILD_DIR/_framework.py"
+if ! grep -q "^BUILD_SOURCE_MTIME_NS = $SOURCE_MTIME_NS$" "$BUILD_DIR/_framework.py"; then
+    echo "❌ BUILD_SOURCE_MTIME_NS não encontrado em _framework.py - hooks seguem em Python puro"
+    exit 1
+fi
+
+echo "🔨 Compilando _framework.py..."
+if ! (cd "$BUILD_DIR" && python3 -m mypyc --ignore-missing-imports _framework.py > build.log 2>&1); then
+    tail -20 "$BUILD_DIR/build.log"
+    echo "❌ Falha na compilação - hooks seguem em Python puro"
+    exit 1
+fi
+
+cp "$BUILD_DIR"/_framework.*.so "$HOOKS_DIR/"
+echo "✅ Módulo compilado instalado em .claude/hooks/"
+echo ""
+echo "💡 Após editar _framework.py os hooks usam o .py até o próximo build"
@@ -0,0 +1,7 @@
+#!/bin/bash
+# /stop-tsc - Encerra o tsc --watch que o hook TypeScript mantém em background
+# O hook inicia o daemon de novo na próxima edição grande de arquivo TypeScript.
+
+HOOKS_DIR="$(cd "$(dirname "$0")/../hooks" && pwd)"
+
+python3 "$HOOKS_DIR/typescript-validation.py" --stop-tsc
@@ -0,0 +1,354 @@
+"""
+Estrutura comum dos hooks de validação - SOS Checkout Brinks
+Leitura da entrada do hook, cache por arquivo, despacho dos checkers e relatório
+Cada hook declara apenas seus checkers, mensagens e dicas e chama run_hook()
+"""
+
+from __future__ import annotations
+
+# Só o necessário para ler a entrada e testar o caminho: arquivos fora do escopo
+# saem sem importar hashlib, mmap ou typing (re já vem com json)
+import json
+import os
+import sys
+from itertools import islice
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import re
+    from typing import Any, Callable, Optional, Sequence
+    
+    # checker(content, content_lower, hits, lower_hits, critical, warnings)
+    Checker = Callable[[str, str, set[str], set[str], list[str], list[str]], None]
+    Checks = Sequence[tuple[Optional[frozenset[str]], Checker]]
+
+# Arquivos grandes: procurar as palavras-chave nos bytes mapeados antes de decodificar
+MMAP_THRESHOLD = 64 * 1024
+
+# pyahocorasick é opcional: importado no primeiro uso (False se ausente)
+_ahocorasick: Any = None
+
+# Autômatos já construídos, por conjunto de literais
+_automatons: dict[frozenset[str], Any] = {}
+
+def cache_dir_for(hook_file: str) -> str:
+    """Diretório .cache ao lado dos hooks"""
+    # Derivado do hook: compilado com mypyc, __file__ deste módulo ainda não é absoluto no import
+    return os.path.join(os.path.dirname(os.path.abspath(hook_file)), '.cache')
+
+def cache_path_for(hook_file: str, file_path: str) -> str:
+    """Uma entrada de cache por arquivo validado: cada edição sobrescreve a anterior"""
+    import hashlib
+    
+    digest = hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=16)
+    hook_name = os.path.splitext(os.path.basename(hook_file))[0]
+    return os.path.join(cache_dir_for(hook_file), f"{hook_name}-{digest.hexdigest()}.json")
+
+def cache_key_for(hook_file: str, content: str) -> str:
+    """Hash do conteúdo; muda quando o hook ou este módulo são editados"""
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for source in (hook_file, __file__):
+        digest.update(str(os.stat(source).st_mtime_ns).encode())
+    digest.update(content.encode('utf-8'))
+    return digest.hexdigest()
+
+def load_cached_issues(cache_path: str, key: str) -> Optional[tuple[list[str], list[str]]]:
+    """Retorna (critical, warnings) salvos para este conteúdo, ou None se não houver"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if cached['key'] != key:
+            return None
+        return cached['critical'], cached['warnings']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_cached_issues(cache_path: str, key: str, critical: list[str], warnings: list[str]) -> None:
+    """Salva os issues de forma atômica; falhas de escrita são ignoradas"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'critical': critical, 'warnings': warnings}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache é opcional, seguir sem ele
+
+def keyword_bytes_pattern(keyword: str) -> bytes:
+    """Padrão em bytes equivalente a 'keyword in content.lower()' (inclusive acentos)"""
+    import re
+    
+    parts: list[bytes] = []
+    for char in keyword:
+        if char.isascii():
+            parts.append(re.escape(char.encode('utf-8')))  # Coberto por re.IGNORECASE
+        else:
+            variants = sorted({char.encode('utf-8'), char.upper().encode('utf-8')})
+            parts.append(b'(?:' + b'|'.join(map(re.escape, variants)) + b')')
+    return b''.join(parts)
+
+def read_content(file_path: str, gate_keywords: Optional[frozenset[str]] = None) -> Optional[str]:
+    """Lê o arquivo; None quando é grande e não contém nenhuma das gate_keywords"""
+    if gate_keywords and os.path.getsize(file_path) >= MMAP_THRESHOLD:
+        import mmap
+        import re
+        
+        gate = re.compile(
+            b'|'.join(keyword_bytes_pattern(keyword) for keyword in sorted(gate_keywords)),
+            re.IGNORECASE
+        )
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if not gate.search(mapped):
+                    return None
+                return mapped[:].decode('utf-8')
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def ahocorasick_module() -> Any:
+    """Módulo pyahocorasick, importado no primeiro uso (None se não instalado)"""
+    global _ahocorasick
+    if _ahocorasick is None:
+        try:
+            import ahocorasick
+            _ahocorasick = ahocorasick
+        except ImportError:
+            _ahocorasick = False
+    return _ahocorasick or None
+
+def literal_automaton(literals: frozenset[str]) -> Any:
+    """Autômato Aho-Corasick dos literais, construído uma vez por conjunto"""
+    automaton = _automatons.get(literals)
+    if automaton is None:
+        automaton = ahocorasick_module().Automaton()
+        for literal in literals:
+            automaton.add_word(literal, literal)
+        automaton.make_automaton()
+        _automatons[literals] = automaton
+    return automaton
+
+def find_literals(text: str, literals: frozenset[str]) -> set[str]:
+    """Conjunto dos literais presentes em text, em uma única varredura quando possível"""
+    if len(literals) <= 4 or ahocorasick_module() is None:
+        return {literal for literal in literals if literal in text}
+    return {literal for _, literal in literal_automaton(literals).iter(text)}
+
+def lazy_patterns(factory: Callable[[], dict[str, Any]]) -> Callable[[], Any]:
+    """Acesso aos padrões do hook, compilados por factory só quando algum arquivo passa pelo filtro de caminho"""
+    compiled: list[Any] = []
+    
+    def patterns() -> Any:
+        if not compiled:
+            from types import SimpleNamespace
+            compiled.append(SimpleNamespace(**factory()))
+        return compiled[0]
+    
+    return patterns
+
+def count_up_to(pattern: re.Pattern[str], text: str, cap: int) -> int:
+    """Conta ocorrências de pattern, parando assim que passar de cap (retorna no máximo cap + 1)"""
+    return sum(1 for _ in islice(pattern.finditer(text), cap + 1))
+
+def run_checks(content: str, checks: Checks, literals: frozenset[str] = frozenset(),
+               lower_literals: frozenset[str] = frozenset()) -> tuple[list[str], list[str]]:
+    """Executa os checkers aplicáveis e retorna (critical, warnings)"""
+    # Uma única cópia em minúsculas, compartilhada por todos os checkers
+    content_lower = content.lower()
+    
+    # Literais procurados uma vez: checkers consultam os conjuntos em vez de varrer o arquivo
+    # (lower_hits também traz as palavras-chave usadas para pular checkers irrelevantes)
+    all_keywords = frozenset().union(*(keywords for keywords, _ in checks if keywords))
+    hits = find_literals(content, literals)
+    lower_hits = find_literals(content_lower, lower_literals | all_keywords)
+    
+    # Executar as validações relevantes, cada uma já separando críticos de warnings
+    critical: list[str] = []
+    warnings: list[str] = []
+    for keywords, check in checks:
+        if keywords is None or not keywords.isdisjoint(lower_hits):
+            check(content, content_lower, hits, lower_hits, critical, warnings)
+    
+    return critical, warnings
+
+def validate_file(hook_file: str, file_path: str, checks: Checks, literals: frozenset[str],
+                  lower_literals: frozenset[str], gate_keywords: Optional[frozenset[str]]
+                  ) -> tuple[Optional[str], list[str], list[str], Optional[Exception]]:
+    """Lê e valida um arquivo; retorna (content, critical, warnings, erro de leitura)"""
+    try:
+        content = read_content(file_path, gate_keywords)
+    except Exception as e:
+        return None, [], [], e
+    
+    if content is None:
+        # Arquivo grande sem nenhuma palavra-chave: nenhum checker se aplica
+        return None, [], [], None
+    
+    # Conteúdo idêntico a uma execução anterior: reaproveitar resultado
+    cache_path = cache_path_for(hook_file, file_path)
+    cache_key = cache_key_for(hook_file, content)
+    cached = load_cached_issues(cache_path, cache_key)
+    if cached is not None:
+        critical, warnings = cached
+    else:
+        critical, warnings = run_checks(content, checks, literals, lower_literals)
+        save_cached_issues(cache_path, cache_key, critical, warnings)
+    
+    return content, critical, warnings, None
+
+def report_issues(file_path: str, critical: list[str], warnings: list[str],
+                  messages: dict[str, str], tips: Sequence[tuple[str, str]],
+                  out: list[str], err: list[str]) -> int:
+    """Acrescenta o resultado de um arquivo às linhas de saída e retorna o exit code"""
+    # Reportar problemas críticos
+    if critical:
+        err.append(f"{messages['critical']}\n")
+        err.extend(f"  • {issue}\n" for issue in critical)
+        err.append(f"{messages['blocked']}\n")
+        return 2  # Bloqueia execução
+    
+    # Reportar warnings
+    if warnings:
+        out.append(f"{messages['warnings']}\n")
+        out.extend(f"  • {warning}\n" for warning in warnings)
+        out.append(f"{messages['warnings_tip']}\n")
+    else:
+        out.append(f"{messages['passed']}\n")
+    
+    # Dicas contextuais
+    path_lower = file_path.lower()
+    for fragment, tip in tips:
+        if fragment in path_lower:
+            out.append(f"{tip}\n")
+            break
+    
+    return 0
+
+def run_hook(hook_file: str, matches_path: Callable[[str], bool], checks: Checks,
+             messages: dict[str, str], tips: Sequence[tuple[str, str]] = (),
+             literals: frozenset[str] = frozenset(), lower_literals: frozenset[str] = frozenset(),
+             skip_without_keywords: bool = False,
+             post_check: Optional[Callable[[list[tuple[str, str]]], list[str]]] = None) -> None:
+    """
+    Ponto de entrada de um hook de validação
+    
+    matches_path(file_path) decide se o arquivo interessa ao hook.
+    checks é a lista (palavras-chave | None, checker) de cada hook.
+    messages traz os textos de start, critical, blocked, warnings, warnings_tip, passed e error.
+    tips são pares (trecho do caminho, dica); só a primeira dica aplicável é exibida.
+    literals / lower_literals: literais que os checkers consultam em hits (no conteúdo)
+    e em lower_hits (no conteúdo em minúsculas).
+    skip_without_keywords: todos os checkers dependem de palavras-chave, então arquivos
+    grandes sem nenhuma delas passam sem decodificar o conteúdo.
+    post_check([(file_path, content), ...]) roda uma vez por execução, fora do cache, e
+    retorna os issues críticos do projeto inteiro (reportados uma única vez).
+    
+    Edições em lote (tool_input.file_paths) são validadas em paralelo e reportadas
+    arquivo a arquivo; o exit code é o mais grave entre eles.
+    """
+    # Saída acumulada e escrita de uma vez por stream no final
+    out: list[str] = []
+    err: list[str] = []
+    
+    try:
+        # Ler dados do hook
+        input_data = json.load(sys.stdin.buffer)
+        tool_input = input_data.get('tool_input', {})
+        requested = tool_input.get('file_paths')
+        # Só uma lista de caminhos vale como lote; senão, o file_path de sempre
+        if not (isinstance(requested, list) and requested
+                and all(isinstance(path, str) for path in requested)):
+            file_path = tool_input.get('file_path', '')
+            requested = [file_path] if isinstance(file_path, str) else []
+        file_paths = [path for path in dict.fromkeys(requested) if matches_path(path)]
+        
+        if not file_paths:
+            # Arquivo fora do escopo do hook, sair silenciosamente
+            sys.exit(0)
+        
+        gate_keywords: Optional[frozenset[str]] = None
+        if skip_without_keywords:
+            gate_keywords = frozenset().union(*(keywords for keywords, _ in checks if keywords))
+        
+        def validate(file_path: str) -> tuple[Optional[str], list[str], list[str], Optional[Exception]]:
+            return validate_file(hook_file, file_path, checks, literals, lower_literals, gate_keywords)
+        
+        if len(file_paths) == 1:
+            results = [validate(file_paths[0])]
+        else:
+            # Leitura e regex em paralelo; o relatório sai agrupado, na ordem recebida
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                results = list(executor.map(validate, file_paths))
+        
+        project_critical: list[str] = []
+        if post_check is not None:
+            checked = [(file_path, content) for file_path, (content, _, _, read_error)
+                       in zip(file_paths, results) if read_error is None and content is not None]
+            if checked:
+                project_critical = post_check(checked)
+        
+        exit_code = 0
+        batch = len(file_paths) > 1
+        if not batch:
+            # Arquivo único: o problema do projeto entra no relatório dele
+            results[0][1].extend(project_critical)
+        
+        for file_path, (content, critical, warnings, read_error) in zip(file_paths, results):
+            header = f"{messages['start']}: {file_path}\n"
+            out.append(header)
+            
+            # Em lote, o stderr (único retorno ao editor com exit 2) também identifica o arquivo
+            if batch and (read_error is not None or critical):
+                err.append(header)
+            
+            if read_error is not None:
+                err.append(f"Erro ao ler arquivo: {read_error}\n")
+                exit_code = max(exit_code, 1)
+                continue
+            
+            exit_code = max(exit_code, report_issues(file_path, critical, warnings, messages, tips, out, err))
+        
+        if batch and project_critical:
+            header = f"{messages['start']}: projeto\n"
+            out.append(header)
+            err.append(header)
+            exit_code = max(exit_code, report_issues('', project_critical, [], messages, (), out, err))
+    
+    except Exception as e:
+        err.append(f"{messages['error']}: {e}\n")
+        exit_code = 1
+    
+    sys.stdout.write(''.join(out))
+    sys.stderr.write(''.join(err))
+    sys.exit(exit_code)
+
+# build-hooks.sh grava na cópia compilada o mtime do _framework.py de origem (0 = Python puro)
+BUILD_SOURCE_MTIME_NS = 0
+
+def load_source_if_stale() -> None:
+    """Módulo compilado mais antigo que o .py: usar as definições do código-fonte"""
+    # No import do módulo compilado __file__ é só o nome do .so: achar o diretório no sys.path
+    for directory in sys.path:
+        if not os.path.exists(os.path.join(directory, __file__)):
+            continue
+        source = os.path.join(directory, '_framework.py')
+        try:
+            if os.stat(source).st_mtime_ns == BUILD_SOURCE_MTIME_NS:
+                return
+        except OSError:
+            return  # Só o .so, sem código-fonte ao lado: usar como está
+        
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(__name__, source)
+        if spec is None or spec.loader is None:
+            return
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        globals().update(vars(module))
+        return
+
+if BUILD_SOURCE_MTIME_NS:
+    load_source_if_stale()
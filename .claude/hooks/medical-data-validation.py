@@ -5,214 +5,253 @@ Executa após edições em formulários médicos e perfis
 Garante LGPD compliance e validação de dados críticos
 """
 
-import json
-import sys
-import re
-import os
+import operator
+
+from _framework import lazy_patterns, run_hook
+
+def compile_patterns():
+    """Regex dos checkers de dados médicos"""
+    import re
+    
+    return dict(
+        sensitive_line=re.compile(r'cpf|bloodtype|medical|allerg'),
+        phone_regex=re.compile(r'regex.*phone|phone.*regex', re.IGNORECASE),
+    )
+
+patterns = lazy_patterns(compile_patterns)
+
+# Pesos dos dígitos verificadores do CPF
+_CPF_WEIGHTS_1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_WEIGHTS_2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+def cpf_digits(cpf):
+    """Dígitos do CPF como bytes com valores 0-9, ignorando a pontuação"""
+    return bytes(c - 48 for c in cpf.encode('utf-8') if 48 <= c <= 57)
 
 def validate_cpf(cpf):
     """Valida CPF brasileiro usando algoritmo oficial"""
-    cpf_clean = re.sub(r'\D', '', cpf)
+    digits = cpf_digits(cpf)
     
-    if len(cpf_clean) != 11:
+    # 11 dígitos, nem todos iguais
+    if len(digits) != 11 or len(set(digits)) == 1:
         return False
     
-    # Verifica se todos os dígitos são iguais
-    if len(set(cpf_clean)) == 1:
+    # Validação dos dígitos verificadores
+    first = sum(map(operator.mul, digits, _CPF_WEIGHTS_1)) * 10 % 11 % 10
+    if first != digits[9]:
         return False
     
-    # Validação dos dígitos verificadores
-    for i in range(9, 11):
-        value = sum((int(cpf_clean[j]) * ((i+1) - j) for j in range(0, i)))
-        digit = ((value * 10) % 11) % 10
-        if digit != int(cpf_clean[i]):
-            return False
+    second = sum(map(operator.mul, digits, _CPF_WEIGHTS_2)) * 10 % 11 % 10
+    return second == digits[10]
+
+def cpf_batch_loop(matrix, weights_1, weights_2, valid):
+    """Laço sobre a matriz de dígitos (uma linha por CPF); compilado com Numba quando disponível"""
+    for row in range(matrix.shape[0]):
+        digits = matrix[row]
+        
+        # Todos os dígitos iguais
+        repeated = True
+        for col in range(1, 11):
+            if digits[col] != digits[0]:
+                repeated = False
+                break
+        if repeated:
+            valid[row] = False
+            continue
+        
+        total = 0
+        for col in range(9):
+            total += digits[col] * weights_1[col]
+        if total * 10 % 11 % 10 != digits[9]:
+            valid[row] = False
+            continue
+        
+        total = 0
+        for col in range(10):
+            total += digits[col] * weights_2[col]
+        valid[row] = total * 10 % 11 % 10 == digits[10]
+
+_compiled_cpf_batch_loop = None
+
+def compiled_cpf_batch_loop():
+    """Versão Numba de cpf_batch_loop, compilada no primeiro uso (None sem Numba)"""
+    global _compiled_cpf_batch_loop
+    if _compiled_cpf_batch_loop is None:
+        try:
+            import numba
+            # cache=True grava o código de máquina em __pycache__ para as próximas execuções
+            _compiled_cpf_batch_loop = numba.njit(cache=True, boundscheck=False)(cpf_batch_loop)
+        except ImportError:
+            _compiled_cpf_batch_loop = False
+    return _compiled_cpf_batch_loop or None
+
+def validate_cpfs(cpfs):
+    """Valida vários CPFs de uma vez; usa Numba ou NumPy quando disponíveis"""
+    try:
+        import numpy as np
+    except ImportError:
+        return [validate_cpf(cpf) for cpf in cpfs]
+    
+    digits = [cpf_digits(cpf) for cpf in cpfs]
+    valid = np.zeros(len(digits), dtype=bool)
+    rows = [i for i, cpf in enumerate(digits) if len(cpf) == 11]
+    if rows:
+        matrix = np.frombuffer(b''.join(digits[i] for i in rows), dtype=np.uint8)
+        matrix = matrix.reshape(-1, 11).astype(np.int64)
+        weights_1 = np.array(_CPF_WEIGHTS_1, dtype=np.int64)
+        weights_2 = np.array(_CPF_WEIGHTS_2, dtype=np.int64)
+        
+        batch_loop = compiled_cpf_batch_loop()
+        if batch_loop is not None:
+            row_valid = np.zeros(len(rows), dtype=bool)
+            batch_loop(matrix, weights_1, weights_2, row_valid)
+        else:
+            first = matrix[:, :9] @ weights_1 * 10 % 11 % 10
+            second = matrix[:, :10] @ weights_2 * 10 % 11 % 10
+            repeated = (matrix == matrix[:, :1]).all(axis=1)
+            row_valid = (first == matrix[:, 9]) & (second == matrix[:, 10]) & ~repeated
+        valid[rows] = row_valid
     
-    return True
+    return valid.tolist()
 
-def check_medical_form_structure(content):
+def check_medical_form_structure(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica estrutura do formulário médico"""
-    issues = []
-    
     # Campos obrigatórios
-    required_fields = [
-        'fullName', 'cpf', 'dateOfBirth', 'bloodType',
-        'emergencyContact', 'phone', 'relationship'
-    ]
-    
-    missing_fields = [field for field in required_fields if field not in content]
+    missing_fields = [field for field in REQUIRED_FIELDS if field not in hits]
     
     if missing_fields:
-        issues.append(f"⚠️ Campos obrigatórios ausentes: {', '.join(missing_fields)}")
+        warnings.append(f"⚠️ Campos obrigatórios ausentes: {', '.join(missing_fields)}")
     
     # Validação de tipo sanguíneo
-    if 'bloodType' in content:
-        valid_types = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
-        if not any(bt in content for bt in valid_types):
-            issues.append("⚠️ Implementar validação de tipo sanguíneo válido")
-    
-    return issues
+    if 'bloodType' in hits:
+        if hits.isdisjoint(VALID_BLOOD_TYPES):
+            warnings.append("⚠️ Implementar validação de tipo sanguíneo válido")
 
-def check_data_sanitization(content):
+def check_data_sanitization(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica sanitização de dados sensíveis"""
-    issues = []
-    
     # Verificar uso de DOMPurify
-    if 'medical' in content.lower() or 'form' in content.lower():
-        if 'DOMPurify' not in content and 'sanitize' not in content:
-            issues.append("🚨 CRÍTICO: Dados médicos devem ser sanitizados (DOMPurify)")
+    if 'DOMPurify' not in hits and 'sanitize' not in hits:
+        critical.append("🚨 CRÍTICO: Dados médicos devem ser sanitizados (DOMPurify)")
+    
+    # Verificar se há console.log de dados sensíveis (busca limitada à linha do log)
+    log_start = content_lower.find('console.log')
+    while log_start != -1:
+        line_end = content_lower.find('\n', log_start)
+        if line_end == -1:
+            line_end = len(content_lower)
         
-        # Verificar se há console.log de dados sensíveis
-        sensitive_patterns = [
-            r'console\.log.*cpf',
-            r'console\.log.*bloodType',
-            r'console\.log.*medical',
-            r'console\.log.*allerg'
-        ]
+        if patterns().sensitive_line.search(content_lower, log_start, line_end):
+            critical.append("🚨 CRÍTICO: Não logar dados médicos sensíveis")
+            break
         
-        for pattern in sensitive_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                issues.append("🚨 CRÍTICO: Não logar dados médicos sensíveis")
-    
-    return issues
+        log_start = content_lower.find('console.log', line_end)
 
-def check_lgpd_compliance(content):
+def check_lgpd_compliance(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica compliance com LGPD"""
-    issues = []
+    # Verificar consentimento
+    if 'consent' not in lower_hits and 'termo' not in lower_hits:
+        warnings.append("⚠️ LGPD: Implementar termo de consentimento")
     
-    if 'medical' in content.lower() or 'profile' in content.lower():
-        # Verificar consentimento
-        if 'consent' not in content.lower() and 'termo' not in content.lower():
-            issues.append("⚠️ LGPD: Implementar termo de consentimento")
-        
-        # Verificar criptografia
-        if 'localStorage' in content or 'sessionStorage' in content:
-            if 'encrypt' not in content.lower() and 'crypto' not in content.lower():
-                issues.append("⚠️ LGPD: Dados sensíveis em storage devem ser criptografados")
-        
-        # Verificar direito ao esquecimento
-        if 'delete' not in content.lower() and 'remove' not in content.lower():
-            issues.append("⚠️ LGPD: Implementar funcão de exclusão de dados")
+    # Verificar criptografia
+    if 'localStorage' in hits or 'sessionStorage' in hits:
+        if 'encrypt' not in lower_hits and 'crypto' not in lower_hits:
+            warnings.append("⚠️ LGPD: Dados sensíveis em storage devem ser criptografados")
     
-    return issues
+    # Verificar direito ao esquecimento
+    if 'delete' not in lower_hits and 'remove' not in lower_hits:
+        warnings.append("⚠️ LGPD: Implementar funcão de exclusão de dados")
 
-def check_validation_schemas(content):
+def check_validation_schemas(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica schemas de validação Zod"""
-    issues = []
+    if 'z.object' not in hits and 'zod' not in lower_hits:
+        warnings.append("⚠️ Implementar validação Zod para formulário médico")
     
-    if 'form' in content.lower() or 'medical' in content.lower():
-        if 'z.object' not in content and 'zod' not in content.lower():
-            issues.append("⚠️ Implementar validação Zod para formulário médico")
-        
-        # Verificar validação de CPF
-        if 'cpf' in content.lower():
-            if 'validateCPF' not in content and 'validarCPF' not in content:
-                issues.append("⚠️ CPF deve ter validação algorítmica completa")
-        
-        # Verificar validação de telefone
-        if 'phone' in content.lower() or 'telefone' in content.lower():
-            if not re.search(r'regex.*phone|phone.*regex', content, re.IGNORECASE):
-                issues.append("⚠️ Telefone deve validar formato (11) 98765-4321")
+    # Verificar validação de CPF
+    if 'cpf' in lower_hits:
+        if 'validateCPF' not in hits and 'validarCPF' not in hits:
+            warnings.append("⚠️ CPF deve ter validação algorítmica completa")
     
-    return issues
+    # Verificar validação de telefone
+    if 'phone' in lower_hits or 'telefone' in lower_hits:
+        if not patterns().phone_regex.search(content):
+            warnings.append("⚠️ Telefone deve validar formato (11) 98765-4321")
 
-def check_emergency_ux(content):
+def check_emergency_ux(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica UX para situações de emergência"""
-    issues = []
+    # Verificar tamanho de fonte
+    if 'fontSize' in hits or 'text-' in hits:
+        if 'text-xs' in hits or 'text-sm' in hits:
+            warnings.append("⚠️ Fonte muito pequena para emergências (mín. 16px)")
     
-    if 'emergency' in content.lower() or 'emergência' in content.lower():
-        # Verificar tamanho de fonte
-        if 'fontSize' in content or 'text-' in content:
-            if 'text-xs' in content or 'text-sm' in content:
-                issues.append("⚠️ Fonte muito pequena para emergências (mín. 16px)")
-        
-        # Verificar contraste
-        if 'text-gray-400' in content or 'text-gray-500' in content:
-            issues.append("⚠️ Contraste baixo para emergências (use WCAG AAA)")
-        
-        # Verificar loading states
-        if 'loading' not in content.lower() and 'spinner' not in content.lower():
-            issues.append("⚠️ Implementar indicadores de carregamento claros")
+    # Verificar contraste
+    if 'text-gray-400' in hits or 'text-gray-500' in hits:
+        warnings.append("⚠️ Contraste baixo para emergências (use WCAG AAA)")
     
-    return issues
+    # Verificar loading states
+    if 'loading' not in lower_hits and 'spinner' not in lower_hits:
+        warnings.append("⚠️ Implementar indicadores de carregamento claros")
 
-def check_offline_support(content):
+def check_offline_support(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica suporte offline para dados críticos"""
-    issues = []
-    
-    if 'medical' in content.lower() or 'qrcode' in content.lower():
-        if 'offline' not in content.lower() and 'cache' not in content.lower():
-            issues.append("⚠️ Implementar cache offline para dados médicos")
-        
-        if 'serviceWorker' not in content and 'service-worker' not in content:
-            issues.append("⚠️ Considerar Service Worker para funcionalidade offline")
+    if 'offline' not in lower_hits and 'cache' not in lower_hits:
+        warnings.append("⚠️ Implementar cache offline para dados médicos")
     
-    return issues
+    if 'serviceWorker' not in hits and 'service-worker' not in hits:
+        warnings.append("⚠️ Considerar Service Worker para funcionalidade offline")
 
-def main():
-    try:
-        # Ler dados do hook
-        input_data = json.load(sys.stdin)
-        file_path = input_data.get('tool_input', {}).get('file_path', '')
-        
-        # Verificar se é arquivo relacionado a dados médicos
-        medical_keywords = ['medical', 'form', 'profile', 'emergency', 'qrcode']
-        if not any(keyword in file_path.lower() for keyword in medical_keywords):
-            # Não é arquivo médico, sair silenciosamente
-            sys.exit(0)
-        
-        print(f"🏥 Validando dados médicos SOS: {file_path}")
-        
-        # Ler conteúdo do arquivo
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Erro ao ler arquivo: {e}", file=sys.stderr)
-            sys.exit(1)
-        
-        # Executar todas as validações
-        all_issues = []
-        all_issues.extend(check_medical_form_structure(content))
-        all_issues.extend(check_data_sanitization(content))
-        all_issues.extend(check_lgpd_compliance(content))
-        all_issues.extend(check_validation_schemas(content))
-        all_issues.extend(check_emergency_ux(content))
-        all_issues.extend(check_offline_support(content))
-        
-        # Separar issues críticos de warnings
-        critical_issues = [issue for issue in all_issues if '🚨 CRÍTICO' in issue]
-        warnings = [issue for issue in all_issues if '⚠️' in issue]
-        
-        # Reportar problemas críticos
-        if critical_issues:
-            print("❌ PROBLEMAS CRÍTICOS DE DADOS MÉDICOS:", file=sys.stderr)
-            for issue in critical_issues:
-                print(f"  • {issue}", file=sys.stderr)
-            print("🛑 Correção OBRIGATÓRIA - Compliance LGPD em risco!", file=sys.stderr)
-            sys.exit(2)  # Bloqueia execução
-        
-        # Reportar warnings
-        if warnings:
-            print("⚠️ Avisos de dados médicos encontrados:")
-            for warning in warnings:
-                print(f"  • {warning}")
-            print("💡 Considere corrigir para melhor compliance e UX")
-        
-        if not all_issues:
-            print("✅ Validação de dados médicos passou!")
-        
-        # Dicas contextuais
-        if 'form' in file_path.lower():
-            print("💡 Lembre-se: Validar CPF com algoritmo completo")
-        elif 'profile' in file_path.lower():
-            print("💡 Lembre-se: Sanitizar todos os dados de entrada")
-        elif 'emergency' in file_path.lower():
-            print("💡 Lembre-se: Interface clara e legível para emergências")
-    
-    except Exception as e:
-        print(f"Erro no hook de validação médica: {e}", file=sys.stderr)
-        sys.exit(1)
+REQUIRED_FIELDS = (
+    'fullName', 'cpf', 'dateOfBirth', 'bloodType',
+    'emergencyContact', 'phone', 'relationship'
+)
+VALID_BLOOD_TYPES = ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-')
+
+# Literais consultados pelos checkers: procurados uma única vez por arquivo
+LITERALS = frozenset({
+    'DOMPurify', 'sanitize', 'localStorage', 'sessionStorage', 'z.object', 'validateCPF', 'validarCPF',
+    'fontSize', 'text-', 'text-xs', 'text-sm', 'text-gray-400', 'text-gray-500',
+    'serviceWorker', 'service-worker',
+    *REQUIRED_FIELDS, *VALID_BLOOD_TYPES,
+})
+LOWER_LITERALS = frozenset({
+    'consent', 'termo', 'encrypt', 'crypto', 'delete', 'remove', 'zod', 'cpf', 'phone', 'telefone',
+    'loading', 'spinner', 'offline', 'cache',
+})
+
+# Cada checker só roda se o conteúdo contiver alguma das palavras-chave (None = sempre)
+CHECKS = [
+    (None, check_medical_form_structure),
+    (frozenset({'medical', 'form'}), check_data_sanitization),
+    (frozenset({'medical', 'profile'}), check_lgpd_compliance),
+    (frozenset({'form', 'medical'}), check_validation_schemas),
+    (frozenset({'emergency', 'emergência'}), check_emergency_ux),
+    (frozenset({'medical', 'qrcode'}), check_offline_support),
+]
+
+def is_medical_file(file_path):
+    """Verifica se é arquivo relacionado a dados médicos"""
+    medical_keywords = ['medical', 'form', 'profile', 'emergency', 'qrcode']
+    path_lower = file_path.lower()
+    return any(keyword in path_lower for keyword in medical_keywords)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_hook(
+        __file__,
+        is_medical_file,
+        CHECKS,
+        messages={
+            'start': "🏥 Validando dados médicos SOS",
+            'critical': "❌ PROBLEMAS CRÍTICOS DE DADOS MÉDICOS:",
+            'blocked': "🛑 Correção OBRIGATÓRIA - Compliance LGPD em risco!",
+            'warnings': "⚠️ Avisos de dados médicos encontrados:",
+            'warnings_tip': "💡 Considere corrigir para melhor compliance e UX",
+            'passed': "✅ Validação de dados médicos passou!",
+            'error': "Erro no hook de validação médica",
+        },
+        tips=[
+            ('form', "💡 Lembre-se: Validar CPF com algoritmo completo"),
+            ('profile', "💡 Lembre-se: Sanitizar todos os dados de entrada"),
+            ('emergency', "💡 Lembre-se: Interface clara e legível para emergências"),
+        ],
+        literals=LITERALS,
+        lower_literals=LOWER_LITERALS
+    )
@@ -6,254 +6,435 @@ Garante type safety e boas práticas TypeScript
 """
 
 import json
-import sys
-import re
 import os
-import subprocess
 
-def check_any_usage(content):
-    """Verifica uso de 'any' no TypeScript"""
-    issues = []
-    
-    # Padrões de uso de any
-    any_patterns = [
-        r':\s*any\b',
-        r'<any>',
-        r'as\s+any\b',
-        r'Array<any>',
-        r'Promise<any>',
-        r'any\[\]'
-    ]
-    
-    for pattern in any_patterns:
-        if re.search(pattern, content):
-            issues.append("🚨 CRÍTICO: Uso de 'any' detectado - Type safety comprometida")
-            break
+from _framework import cache_dir_for, count_up_to, lazy_patterns, run_hook
+
+def compile_patterns():
+    """Regex dos checkers TypeScript"""
+    import re
     
-    return issues
+    return dict(
+        any_type=re.compile(r':\s*any\b|<any>|as\s+any\b|Array<any>|Promise<any>|any\[\]'),
+        non_null=re.compile(r'\w+!\.'),
+        double_cast=re.compile(r'as\s+unknown\s+as'),
+        interface=re.compile(r'interface\s+(\w+)'),
+        type_alias=re.compile(r'type\s+(\w+)'),
+        func_no_return=re.compile(r'(?:async\s+)?function\s+\w+\([^)]*\)\s*{'),
+        arrow=re.compile(r'const\s+\w+\s*=\s*(?:async\s+)?\([^)]*\)\s*=>'),
+        catch_var=re.compile(r'catch\s*\(\s*(\w+)\s*\)'),
+        named_import=re.compile(r'import\s+{[^}]+}\s+from\s+["\']([^"\']+)["\']'),
+    )
 
-def check_type_assertions(content):
+patterns = lazy_patterns(compile_patterns)
+
+def check_any_usage(content, content_lower, hits, lower_hits, critical, warnings):
+    """Verifica uso de 'any' no TypeScript"""
+    # Padrões de uso de any (': any', '<any>', 'as any', 'Array<any>', 'Promise<any>', 'any[]')
+    if patterns().any_type.search(content):
+        critical.append("🚨 CRÍTICO: Uso de 'any' detectado - Type safety comprometida")
+
+def check_type_assertions(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica assertions perigosas"""
-    issues = []
-    
     # Verificar uso excessivo de '!'
-    non_null_assertions = re.findall(r'\w+!\.', content)
-    if len(non_null_assertions) > 3:
-        issues.append("⚠️ Muitas non-null assertions (!) - Verificar nullability")
+    if count_up_to(patterns().non_null, content, 3) > 3:
+        warnings.append("⚠️ Muitas non-null assertions (!) - Verificar nullability")
     
     # Verificar 'as' casting perigoso
-    if re.search(r'as\s+unknown\s+as', content):
-        issues.append("🚨 CRÍTICO: Double casting detectado (as unknown as)")
+    if patterns().double_cast.search(content):
+        critical.append("🚨 CRÍTICO: Double casting detectado (as unknown as)")
     
     # @ts-ignore é proibido
-    if '@ts-ignore' in content:
-        issues.append("🚨 CRÍTICO: @ts-ignore não é permitido - Corrigir erro TypeScript")
+    if '@ts-ignore' in hits:
+        critical.append("🚨 CRÍTICO: @ts-ignore não é permitido - Corrigir erro TypeScript")
     
     # @ts-nocheck é proibido
-    if '@ts-nocheck' in content:
-        issues.append("🚨 CRÍTICO: @ts-nocheck não é permitido")
-    
-    return issues
+    if '@ts-nocheck' in hits:
+        critical.append("🚨 CRÍTICO: @ts-nocheck não é permitido")
 
-def check_interface_conventions(content):
+def check_interface_conventions(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica convenções de interfaces e tipos"""
-    issues = []
-    
     # Interfaces devem ter prefixo I
-    interfaces = re.findall(r'interface\s+(\w+)', content)
+    interfaces = patterns().interface.findall(content)
     for interface in interfaces:
         if not interface.startswith('I'):
-            issues.append(f"⚠️ Interface '{interface}' deve ter prefixo 'I'")
+            warnings.append(f"⚠️ Interface '{interface}' deve ter prefixo 'I'")
     
     # Types devem ter prefixo T
-    types = re.findall(r'type\s+(\w+)', content)
+    types = patterns().type_alias.findall(content)
     for type_name in types:
         if not type_name.startswith('T'):
-            issues.append(f"⚠️ Type '{type_name}' deve ter prefixo 'T'")
-    
-    return issues
+            warnings.append(f"⚠️ Type '{type_name}' deve ter prefixo 'T'")
 
-def check_strict_mode(content):
+def check_strict_mode(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica configurações strict do TypeScript"""
-    issues = []
-    
-    if 'tsconfig' in content.lower():
-        if '"strict": false' in content:
-            issues.append("🚨 CRÍTICO: Strict mode deve estar ativo")
-        
-        required_flags = [
-            'strictNullChecks',
-            'strictFunctionTypes',
-            'strictBindCallApply',
-            'noImplicitAny',
-            'noImplicitThis'
-        ]
-        
-        for flag in required_flags:
-            if f'"{flag}": false' in content:
-                issues.append(f"⚠️ Flag {flag} deve estar true")
+    if '"strict": false' in hits:
+        critical.append("🚨 CRÍTICO: Strict mode deve estar ativo")
     
-    return issues
+    for flag in REQUIRED_STRICT_FLAGS:
+        if f'"{flag}": false' in hits:
+            warnings.append(f"⚠️ Flag {flag} deve estar true")
 
-def check_return_types(content):
+def check_return_types(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica se funções têm tipos de retorno explícitos"""
-    issues = []
-    
     # Funções sem tipo de retorno
-    functions_without_return = re.findall(
-        r'(?:async\s+)?function\s+\w+\([^)]*\)\s*{',
-        content
-    )
+    functions_without_return = count_up_to(patterns().func_no_return, content, 5)
     
-    arrow_functions_without_return = re.findall(
-        r'const\s+\w+\s*=\s*(?:async\s+)?\([^)]*\)\s*=>',
-        content
-    )
+    arrow_functions_without_return = count_up_to(patterns().arrow, content, 5)
     
-    if len(functions_without_return) + len(arrow_functions_without_return) > 5:
-        issues.append("⚠️ Muitas funções sem tipo de retorno explícito")
-    
-    return issues
+    if functions_without_return + arrow_functions_without_return > 5:
+        warnings.append("⚠️ Muitas funções sem tipo de retorno explícito")
 
-def check_error_handling(content):
+def check_error_handling(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica tratamento de erros tipado"""
-    issues = []
+    import re
     
-    # Catch blocks sem tipo
-    catch_blocks = re.findall(r'catch\s*\(\s*(\w+)\s*\)', content)
-    for error_var in catch_blocks:
-        if not re.search(f'{error_var}\\s*:\\s*\\w+', content):
-            issues.append("⚠️ Variável de erro em catch sem tipo")
+    # Catch blocks sem tipo: uma única busca cobre todas as variáveis de erro
+    catch_blocks = patterns().catch_var.findall(content)
+    if catch_blocks:
+        alternatives = '|'.join(map(re.escape, sorted(set(catch_blocks))))
+        typed_vars = set(re.findall(rf'\b({alternatives})\s*:\s*\w', content))
+        for error_var in catch_blocks:
+            if error_var not in typed_vars:
+                warnings.append("⚠️ Variável de erro em catch sem tipo")
     
     # Promises sem tratamento de erro
-    if 'Promise' in content and '.catch' not in content and 'try' not in content:
-        issues.append("⚠️ Promises devem ter tratamento de erro")
-    
-    return issues
+    if 'Promise' in hits and '.catch' not in hits and 'try' not in hits:
+        warnings.append("⚠️ Promises devem ter tratamento de erro")
 
-def check_imports(content):
+def check_imports(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica imports e dependencies"""
-    issues = []
-    
     # Import com require (não usar em TypeScript)
-    if 'require(' in content and '.tsx' in content:
-        issues.append("⚠️ Usar import ES6 ao invés de require()")
+    if 'require(' in hits and '.tsx' in hits:
+        warnings.append("⚠️ Usar import ES6 ao invés de require()")
     
     # Imports sem tipos
-    if 'import ' in content:
-        untyped_imports = re.findall(r'import\s+{[^}]+}\s+from\s+["\']([^"\']+)["\']', content)
+    if 'import ' in hits:
+        untyped_imports = patterns().named_import.findall(content)
         for imp in untyped_imports:
-            if not imp.startswith('.') and '@types/' not in content:
+            if not imp.startswith('.') and '@types/' not in hits:
                 if imp in ['react', 'react-dom', 'axios', 'zod']:
-                    issues.append(f"⚠️ Verificar se @types/{imp} está instalado")
-    
-    return issues
+                    warnings.append(f"⚠️ Verificar se @types/{imp} está instalado")
 
-def check_component_types(content):
+def check_component_types(content, content_lower, hits, lower_hits, critical, warnings):
     """Verifica tipos em componentes React"""
-    issues = []
-    
-    if '.tsx' in content or 'React' in content:
+    if '.tsx' in hits or 'React' in hits:
         # Props sem tipo
-        if 'props)' in content and 'props:' not in content:
-            issues.append("⚠️ Props de componente sem tipo")
+        if 'props)' in hits and 'props:' not in hits:
+            warnings.append("⚠️ Props de componente sem tipo")
         
         # useState sem tipo genérico
-        if 'useState(' in content and 'useState<' not in content:
-            issues.append("⚠️ useState deve ter tipo genérico")
+        if 'useState(' in hits and 'useState<' not in hits:
+            warnings.append("⚠️ useState deve ter tipo genérico")
         
         # useEffect sem cleanup quando necessário
-        if 'setInterval' in content or 'addEventListener' in content:
-            if 'return () =>' not in content:
-                issues.append("⚠️ useEffect com side effects precisa cleanup")
+        if 'setInterval' in hits or 'addEventListener' in hits:
+            if 'return () =>' not in hits:
+                warnings.append("⚠️ useEffect com side effects precisa cleanup")
+
+REQUIRED_STRICT_FLAGS = (
+    'strictNullChecks',
+    'strictFunctionTypes',
+    'strictBindCallApply',
+    'noImplicitAny',
+    'noImplicitThis'
+)
+
+# Literais consultados pelos checkers: procurados uma única vez por arquivo
+LITERALS = frozenset({
+    '@ts-ignore', '@ts-nocheck', '"strict": false', 'Promise', '.catch', 'try',
+    'require(', '.tsx', 'import ', '@types/', 'React', 'props)', 'props:',
+    'useState(', 'useState<', 'setInterval', 'addEventListener', 'return () =>',
+    *(f'"{flag}": false' for flag in REQUIRED_STRICT_FLAGS),
+})
+
+# Cada checker só roda se o conteúdo contiver alguma das palavras-chave (None = sempre)
+CHECKS = [
+    (None, check_any_usage),
+    (None, check_type_assertions),
+    (None, check_interface_conventions),
+    (frozenset({'tsconfig'}), check_strict_mode),
+    (None, check_return_types),
+    (None, check_error_handling),
+    (None, check_imports),
+    (frozenset({'.tsx', 'react'}), check_component_types),
+]
+
+# tsc --watch persistente: amortiza o cold start de Node/TypeScript entre execuções
+CACHE_DIR = cache_dir_for(__file__)
+TSC_PID_FILE = os.path.join(CACHE_DIR, 'tsc.pid')
+TSC_LOCK_FILE = os.path.join(CACHE_DIR, 'tsc.lock')
+TSC_LOG_FILE = os.path.join(CACHE_DIR, 'tsc.log')
+TSC_LAST_CYCLE_FILE = os.path.join(CACHE_DIR, 'tsc.last')
+TSC_BUILD_INFO = os.path.join(CACHE_DIR, 'tsbuild.json')
+TSC_WAIT_SECONDS = 10
+TSC_SETTLE_SECONDS = 0.5  # Acima do debounce de 250 ms do tsc --watch
+TSC_LOG_MAX_BYTES = 1024 * 1024
+TYPE_CHECK_TIMEOUT = 30
+TSC_BIN = os.path.join('node_modules', '.bin', 'tsc')
+
+def tsc_log_size():
+    """Tamanho atual do log do daemon (0 se ainda não existe)"""
+    try:
+        return os.path.getsize(TSC_LOG_FILE)
+    except OSError:
+        return 0
+
+# Lido no início do hook: ciclos que começam depois deste ponto do log começaram depois do save
+HOOK_LOG_OFFSET = tsc_log_size()
+
+def tsc_daemon_pid():
+    """PID do tsc --watch registrado em tsc.pid, se ainda estiver vivo"""
+    try:
+        with open(TSC_PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+        # Iniciado com start_new_session: lidera o próprio grupo (evita PID reaproveitado)
+        if os.getpgid(pid) != pid:
+            return None
+        return pid
+    except (OSError, ValueError):
+        return None
+
+def tsc_daemon_running():
+    """Verifica se o tsc --watch registrado em tsc.pid ainda está vivo"""
+    return tsc_daemon_pid() is not None
+
+def stop_tsc_daemon():
+    """Encerra o tsc --watch em background e remove o tsc.pid"""
+    import signal
+    
+    pid = tsc_daemon_pid()
+    if pid is None:
+        print("ℹ️ Nenhum tsc --watch em execução")
+    else:
+        try:
+            os.killpg(pid, signal.SIGTERM)
+            print(f"🛑 tsc --watch encerrado (PID {pid})")
+        except OSError:
+            pass  # Já terminou
     
-    return issues
+    try:
+        os.remove(TSC_PID_FILE)
+    except OSError:
+        pass
 
-def run_type_check():
-    """Executa npm run type-check se disponível"""
+def start_tsc_daemon():
+    """Inicia tsc --watch --incremental em background, desacoplado do hook"""
+    if not os.path.exists(TSC_BIN):
+        return  # TypeScript não instalado no projeto
+    
+    import fcntl
+    import subprocess
+    
     try:
-        result = subprocess.run(
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(TSC_LOCK_FILE, 'w') as lock:
+            # Um daemon por projeto: hooks simultâneos disputam o lock e só um inicia o tsc
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return  # Outro hook está iniciando o daemon
+            if tsc_daemon_running():
+                return  # Iniciado por outro hook entre a checagem e o lock
+            
+            # Resumo de um daemon anterior não vale para o novo
+            try:
+                os.remove(TSC_LAST_CYCLE_FILE)
+            except OSError:
+                pass
+            
+            # Modo append: o hook pode truncar o log sem o tsc voltar a escrever no offset antigo
+            with open(TSC_LOG_FILE, 'a') as log:
+                log.truncate(0)
+                proc = subprocess.Popen(
+                    [TSC_BIN, '--watch', '--incremental',
+                     '--tsBuildInfoFile', TSC_BUILD_INFO, '--noEmit',
+                     '--preserveWatchOutput', '--pretty', 'false'],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True
+                )
+            # Gravado antes de soltar o lock: quem entrar depois já vê o daemon
+            with open(TSC_PID_FILE, 'w') as f:
+                f.write(str(proc.pid))
+    except OSError:
+        pass  # Daemon é opcional, seguir com npm run type-check
+
+def tsc_program_files():
+    """Arquivos do programa observado pelo daemon, lidos do tsbuildinfo"""
+    try:
+        with open(TSC_BUILD_INFO, 'rb') as f:
+            build_info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # TypeScript < 5.6 aninha os dados em "program"
+    file_names = build_info.get('program', build_info).get('fileNames', [])
+    base_dir = os.path.dirname(TSC_BUILD_INFO)
+    return {os.path.normpath(os.path.join(base_dir, name)) for name in file_names}
+
+def read_tsc_daemon_errors(file_paths):
+    """Erros do projeto no primeiro ciclo do daemon que inclui as edições (None se indisponível)"""
+    import time
+    
+    targets = [os.path.abspath(file_path) for file_path in file_paths]
+    program_files = tsc_program_files()
+    # Arquivos fora do programa não disparam ciclo novo: vale o último ciclo completo
+    in_program = program_files is None or any(target in program_files for target in targets)
+    
+    deadline = time.monotonic() + TSC_WAIT_SECONDS
+    hook_offset = HOOK_LOG_OFFSET
+    try:
+        # O ciclo precisa cobrir o save mais recente do lote
+        edited_at = max(os.stat(target).st_mtime for target in targets)
+        log, log_key = b'', None
+        while True:
+            log_stat = os.stat(TSC_LOG_FILE)
+            if (log_stat.st_size, log_stat.st_mtime_ns) != log_key:
+                with open(TSC_LOG_FILE, 'rb') as f:
+                    log = f.read()
+                log_key = (log_stat.st_size, log_stat.st_mtime_ns)
+                if len(log) < hook_offset:
+                    hook_offset = 0  # Log truncado por outra execução
+            
+            started = max(log.rfind(b'Starting compilation in watch mode'),
+                          log.rfind(b'File change detected'))
+            finished = log.rfind(b'Watching for file changes.')
+            if started != -1 and finished > started:
+                # Ciclo iniciado antes do hook só vale se terminou após o save e o log
+                # ficou quieto além do debounce: com o save no meio dele, o tsc já teria
+                # registrado um "File change detected" novo
+                settled = (log_stat.st_mtime >= edited_at
+                           and time.time() - log_stat.st_mtime >= TSC_SETTLE_SECONDS)
+                if started >= hook_offset or not in_program or settled:
+                    return log.count(b'error TS', started, finished)
+            elif started == -1 and not in_program:
+                # Log rotacionado e nenhum ciclo desde então: vale o resumo salvo na rotação
+                errors = last_cycle_errors()
+                if errors is not None:
+                    return errors
+            
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.1)
+    except OSError:
+        return None
+
+def last_cycle_errors():
+    """Erros do último ciclo antes da rotação do log (None se não houver)"""
+    try:
+        with open(TSC_LAST_CYCLE_FILE, 'r') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+def rotate_tsc_log(errors):
+    """Trunca o log do daemon (--preserveWatchOutput só acrescenta) quando passa do limite"""
+    if tsc_log_size() > TSC_LOG_MAX_BYTES:
+        try:
+            # O resumo substitui o último ciclo, que sai do log junto com o resto
+            with open(TSC_LAST_CYCLE_FILE, 'w') as f:
+                f.write(str(errors))
+            os.truncate(TSC_LOG_FILE, 0)
+        except OSError:
+            pass  # Tenta de novo na próxima execução
+
+def kill_process_group(proc):
+    """Encerra o processo e seus filhos (npm dispara o tsc em outro processo)"""
+    import signal
+    
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except OSError:
+        pass  # Já terminou
+
+def run_npm_type_check():
+    """Executa npm run type-check e retorna se houve erro de compilação"""
+    import subprocess
+    import threading
+    
+    try:
+        proc = subprocess.Popen(
             ['npm', 'run', 'type-check'],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=30
+            errors='replace',
+            bufsize=1,
+            start_new_session=True
         )
-        
-        if result.returncode != 0:
-            return ["🚨 CRÍTICO: TypeScript compilation failed - Corrigir erros"]
-        return []
-    except:
-        return []  # Comando não disponível, ignorar
-
-def main():
+    except OSError:
+        return False  # Comando não disponível, ignorar
+    
+    # Estourou o tempo: encerrar npm e tsc e ignorar, como comando indisponível
+    timer = threading.Timer(TYPE_CHECK_TIMEOUT, kill_process_group, (proc,))
+    timer.start()
     try:
-        # Ler dados do hook
-        input_data = json.load(sys.stdin)
-        file_path = input_data.get('tool_input', {}).get('file_path', '')
-        
-        # Verificar se é arquivo TypeScript
-        if not file_path.endswith(('.ts', '.tsx', 'tsconfig.json')):
-            # Não é arquivo TypeScript, sair silenciosamente
-            sys.exit(0)
-        
-        print(f"📘 Validando TypeScript: {file_path}")
-        
-        # Ler conteúdo do arquivo
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Erro ao ler arquivo: {e}", file=sys.stderr)
-            sys.exit(1)
-        
-        # Executar todas as validações
-        all_issues = []
-        all_issues.extend(check_any_usage(content))
-        all_issues.extend(check_type_assertions(content))
-        all_issues.extend(check_interface_conventions(content))
-        all_issues.extend(check_strict_mode(content))
-        all_issues.extend(check_return_types(content))
-        all_issues.extend(check_error_handling(content))
-        all_issues.extend(check_imports(content))
-        all_issues.extend(check_component_types(content))
-        
-        # Se for alteração significativa, rodar type-check
-        if len(content.splitlines()) > 50:
-            all_issues.extend(run_type_check())
-        
-        # Separar issues críticos de warnings
-        critical_issues = [issue for issue in all_issues if '🚨 CRÍTICO' in issue]
-        warnings = [issue for issue in all_issues if '⚠️' in issue]
-        
-        # Reportar problemas críticos
-        if critical_issues:
-            print("❌ PROBLEMAS CRÍTICOS TYPESCRIPT:", file=sys.stderr)
-            for issue in critical_issues:
-                print(f"  • {issue}", file=sys.stderr)
-            print("🛑 Correção OBRIGATÓRIA - Type safety em risco!", file=sys.stderr)
-            sys.exit(2)  # Bloqueia execução
-        
-        # Reportar warnings
-        if warnings:
-            print("⚠️ Avisos TypeScript encontrados:")
-            for warning in warnings:
-                print(f"  • {warning}")
-            print("💡 Considere corrigir para melhor type safety")
-        
-        if not all_issues:
-            print("✅ Validação TypeScript passou!")
-        
-        # Dicas contextuais
-        if '.tsx' in file_path:
-            print("💡 Lembre-se: Componentes devem ter props tipadas")
-        elif 'schema' in file_path.lower():
-            print("💡 Lembre-se: Usar Zod para validação runtime")
-        elif 'api' in file_path.lower():
-            print("💡 Lembre-se: Tipar requests e responses")
+        for line in proc.stdout:
+            # O primeiro erro já decide o resultado, sem esperar o fim da compilação
+            if 'error TS' in line:
+                kill_process_group(proc)
+                return True
+        proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    
+    return proc.returncode > 0
+
+def type_check_failed(file_paths):
+    """Consulta o tsc --watch persistente; sem ele, inicia o daemon e executa npm run type-check"""
+    # Nos dois caminhos qualquer erro do projeto bloqueia, não só os do arquivo editado:
+    # um tipo exportado que quebra quem o consome também é detectado
+    if tsc_daemon_running():
+        errors = read_tsc_daemon_errors(file_paths)
+        if errors is not None:
+            rotate_tsc_log(errors)
+            return errors > 0
+    else:
+        start_tsc_daemon()  # Aquecido para as próximas execuções
     
-    except Exception as e:
-        print(f"Erro no hook de validação TypeScript: {e}", file=sys.stderr)
-        sys.exit(1)
+    return run_npm_type_check()
+
+def type_check_large_files(files):
+    """Se houver alteração significativa, rodar type-check uma vez para o lote inteiro"""
+    if any(len(content.splitlines()) > 50 for _, content in files):
+        if type_check_failed([file_path for file_path, _ in files]):
+            return ["🚨 CRÍTICO: TypeScript compilation failed - Corrigir erros"]
+    return []
+
+def is_typescript_file(file_path):
+    """Verifica se é arquivo TypeScript"""
+    return file_path.endswith(('.ts', '.tsx', 'tsconfig.json'))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import sys
+    
+    # /stop-tsc: encerrar o daemon em vez de validar
+    if sys.argv[1:] == ['--stop-tsc']:
+        stop_tsc_daemon()
+        sys.exit(0)
+    
+    run_hook(
+        __file__,
+        is_typescript_file,
+        CHECKS,
+        messages={
+            'start': "📘 Validando TypeScript",
+            'critical': "❌ PROBLEMAS CRÍTICOS TYPESCRIPT:",
+            'blocked': "🛑 Correção OBRIGATÓRIA - Type safety em risco!",
+            'warnings': "⚠️ Avisos TypeScript encontrados:",
+            'warnings_tip': "💡 Considere corrigir para melhor type safety",
+            'passed': "✅ Validação TypeScript passou!",
+            'error': "Erro no hook de validação TypeScript",
+        },
+        tips=[
+            ('.tsx', "💡 Lembre-se: Componentes devem ter props tipadas"),
+            ('schema', "💡 Lembre-se: Usar Zod para validação runtime"),
+            ('api', "💡 Lembre-se: Tipar requests e responses"),
+        ],
+        literals=LITERALS,
+        post_check=type_check_large_files
+    )